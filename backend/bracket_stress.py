@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Concurrency stress check for bracket scoring against a real PostgreSQL.
+
+Usage: docker compose exec web python bracket_stress.py
+
+Creates a throwaway 8-pair tournament, hammers set_bracket_score / generate_bracket
+from 50 parallel writers and checks that no update is lost, then deletes it.
+Exits with code 1 if any check fails.
+"""
+import sys, random, threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import psycopg2
+import psycopg2.extras
+
+from app import app, DATABASE_URL
+
+WRITERS = 50
+BRACKET_SIZE = 8
+FIRST_ROUND = 3  # log2(BRACKET_SIZE): quarterfinals
+PAIR1_WINS = {"score_pair1": "6:3 6:4", "score_pair2": "3:6 4:6"}
+PAIR2_WINS = {"score_pair1": "3:6 4:6", "score_pair2": "6:3 6:4"}
+
+failures = []
+
+
+def check(ok, msg):
+    print(("✅ " if ok else "❌ ") + msg)
+    if not ok:
+        failures.append(msg)
+
+
+def db():
+    return psycopg2.connect(DATABASE_URL, cursor_factory=psycopg2.extras.RealDictCursor)
+
+
+def create_tournament():
+    conn = db()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("""INSERT INTO tournaments (title, category, category_type, group_format, bracket_size)
+                           VALUES (%s,%s,%s,%s,%s) RETURNING id""",
+                        ("bracket_stress", "test", "men_doubles",
+                         '{"total_pairs":8,"groups":2,"pairs_per_group":4}', BRACKET_SIZE))
+            tid = cur.fetchone()["id"]
+            for i in range(BRACKET_SIZE):
+                cur.execute("""INSERT INTO tournament_pairs (tournament_id, player1_name, player2_name, group_number)
+                               VALUES (%s,%s,%s,%s)""",
+                            (tid, f"Stress {i + 1}A", f"Stress {i + 1}B", i % 2 + 1))
+            conn.commit()
+        return tid
+    finally:
+        conn.close()
+
+
+def drop_tournament(tid):
+    conn = db()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM bracket_matches WHERE tournament_id=%s", (tid,))
+            cur.execute("DELETE FROM group_matches WHERE tournament_id=%s", (tid,))
+            cur.execute("DELETE FROM tournaments WHERE id=%s", (tid,))
+            conn.commit()
+    finally:
+        conn.close()
+
+
+def load_bracket(tid):
+    """(round, match_number) -> row, read from primary"""
+    conn = db()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT * FROM bracket_matches WHERE tournament_id=%s", (tid,))
+            rows = cur.fetchall()
+    finally:
+        conn.close()
+    return {(r["round"], r["match_number"]): r for r in rows}, len(rows)
+
+
+def client():
+    c = app.test_client()
+    with c.session_transaction() as s:
+        s["user_id"] = 0
+        s["is_superuser"] = True
+    return c
+
+
+def run_parallel(jobs):
+    """Run job(client) for every job at once; returns their results in order"""
+    barrier = threading.Barrier(len(jobs))
+
+    def run(job):
+        c = client()
+        barrier.wait()
+        return job(c)
+
+    with ThreadPoolExecutor(max_workers=len(jobs)) as ex:
+        return list(ex.map(run, jobs))
+
+
+def regenerate(tid):
+    r = client().post(f"/api/tournaments/{tid}/bracket/generate")
+    assert r.status_code == 200, r.get_json()
+    return load_bracket(tid)[0]
+
+
+def score_job(tid, mid, payload):
+    return lambda c: c.put(f"/api/tournaments/{tid}/bracket/{mid}/score", json=payload).status_code
+
+
+def stored_winner(m):
+    """Winner implied by the score actually stored on the row"""
+    return m["pair1_id"] if m["score_pair1"] == PAIR1_WINS["score_pair1"] else m["pair2_id"]
+
+
+def no_lost_updates(tid):
+    """Sibling and same-match writers: every write is counted and propagated"""
+    bracket = regenerate(tid)
+    rnd = random.Random(0)
+    writes = Counter()
+    jobs = []
+    for i in range(WRITERS):
+        mn = i % 4 + 1
+        writes[mn] += 1
+        jobs.append(score_job(tid, bracket[(FIRST_ROUND, mn)]["id"],
+                              rnd.choice([PAIR1_WINS, PAIR2_WINS])))
+    statuses = run_parallel(jobs)
+    check(all(s == 200 for s in statuses), f"{WRITERS} parallel scores all succeed: {Counter(statuses)}")
+
+    bracket, _ = load_bracket(tid)
+    for mn in range(1, 5):
+        m = bracket[(FIRST_ROUND, mn)]
+        check(m["version"] == writes[mn], f"R{FIRST_ROUND} match {mn}: version {m['version']} == {writes[mn]} writes")
+        check(m["winner_pair_id"] == stored_winner(m), f"R{FIRST_ROUND} match {mn}: winner matches stored score")
+    for mn in range(1, 3):
+        nxt = bracket[(FIRST_ROUND - 1, mn)]
+        left, right = bracket[(FIRST_ROUND, 2 * mn - 1)], bracket[(FIRST_ROUND, 2 * mn)]
+        expected = writes[2 * mn - 1] + writes[2 * mn]
+        check(nxt["version"] == expected, f"R{FIRST_ROUND - 1} match {mn}: version {nxt['version']} == {expected} propagations")
+        check(nxt["pair1_id"] == left["winner_pair_id"] and nxt["pair2_id"] == right["winner_pair_id"],
+              f"R{FIRST_ROUND - 1} match {mn}: pair1/pair2 are the final winners of matches {2 * mn - 1}/{2 * mn}")
+
+
+def optimistic_conflicts(tid):
+    """Writers that all saw version 0: exactly one wins, the rest get 409"""
+    bracket = regenerate(tid)
+    mid = bracket[(FIRST_ROUND, 1)]["id"]
+    jobs = [score_job(tid, mid, dict(PAIR1_WINS if i % 2 else PAIR2_WINS, version=0)) for i in range(WRITERS)]
+    statuses = Counter(run_parallel(jobs))
+    check(statuses == Counter({200: 1, 409: WRITERS - 1}), f"one 200 and {WRITERS - 1} conflicts: {statuses}")
+    bracket, _ = load_bracket(tid)
+    check(bracket[(FIRST_ROUND, 1)]["version"] == 1, "contested match written exactly once")
+    check(bracket[(FIRST_ROUND - 1, 1)]["version"] == 1, "winner propagated exactly once")
+
+
+def scores_during_regeneration(tid):
+    """Scores racing several regenerations never leak into the new bracket"""
+    bracket = regenerate(tid)
+    generators = 5
+
+    def generate(c):
+        return ("generate", c.post(f"/api/tournaments/{tid}/bracket/generate").status_code)
+
+    jobs = [generate] * generators
+    for i in range(WRITERS - generators):
+        mid = bracket[(FIRST_ROUND, i % 4 + 1)]["id"]
+        job = score_job(tid, mid, PAIR1_WINS)
+        jobs.append(lambda c, job=job: ("score", job(c)))
+    results = run_parallel(jobs)
+    gen = Counter(s for kind, s in results if kind == "generate")
+    scores = Counter(s for kind, s in results if kind == "score")
+    check(gen == Counter({200: generators}), f"all regenerations succeed: {gen}")
+    check(set(scores) <= {200, 404}, f"scores either land before a regeneration or miss the old match: {scores}")
+
+    bracket, rows = load_bracket(tid)
+    check(rows == BRACKET_SIZE - 1, f"exactly one bracket exists: {rows} rows")
+    check(all(m["version"] == 0 and m["winner_pair_id"] is None for m in bracket.values()),
+          "regenerated bracket carries no scores from the old one")
+    check(all(m["pair1_id"] is None and m["pair2_id"] is None
+              for (r, _), m in bracket.items() if r < FIRST_ROUND),
+          "nothing was propagated into later rounds of the new bracket")
+
+
+if __name__ == "__main__":
+    tid = create_tournament()
+    try:
+        no_lost_updates(tid)
+        optimistic_conflicts(tid)
+        scores_during_regeneration(tid)
+    finally:
+        drop_tournament(tid)
+    if failures:
+        print(f"{len(failures)} проверок не прошло.")
+        sys.exit(1)
+    print("Все проверки пройдены.")
@@ -57,7 +57,7 @@ export default function TournamentDetail() {
         setScores(sc);
         const bsc = {};
         (r.data.bracket || []).forEach(m => {
-          bsc[m.id] = { score1: m.score_pair1 || "", score2: m.score_pair2 || "" };
+          bsc[m.id] = { score1: m.score_pair1 || "", score2: m.score_pair2 || "", version: m.version };
         });
         setBScores(bsc);
         setLoading(false);
@@ -147,10 +147,16 @@ export default function TournamentDetail() {
       await api.put(`/tournaments/${id}/bracket/${mid}/score`, {
         score_pair1: bScores[mid]?.score1 || "",
         score_pair2: bScores[mid]?.score2 || "",
+        version: bScores[mid]?.version,
       });
       showMsg("Счёт сохранён");
       load();
-    } catch { showMsg("Ошибка сохранения", "error"); }
+    } catch (e) {
+      if (e.response?.status === 409) {
+        showMsg(e.response.data.error, "error");
+        load();
+      } else showMsg("Ошибка сохранения", "error");
+    }
     finally { setSavingBScore(null); }
   };
 
@@ -69,7 +69,8 @@ CREATE TABLE IF NOT EXISTS bracket_matches (
     pair2_id INTEGER REFERENCES tournament_pairs(id),
     score_pair1 VARCHAR(50),
     score_pair2 VARCHAR(50),
-    winner_pair_id INTEGER REFERENCES tournament_pairs(id)
+    winner_pair_id INTEGER REFERENCES tournament_pairs(id),
+    version INTEGER NOT NULL DEFAULT 0
 );
 
 CREATE TABLE IF NOT EXISTS ratings (
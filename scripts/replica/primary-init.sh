@@ -0,0 +1,7 @@
+#!/bin/sh
+# Runs once on the primary's first start: replication role + pg_hba entry for the standby
+set -e
+psql -v ON_ERROR_STOP=1 -U "$POSTGRES_USER" -d "$POSTGRES_DB" <<SQL
+CREATE ROLE replicator WITH REPLICATION LOGIN PASSWORD 'replicator';
+SQL
+echo "host replication replicator all md5" >> "$PGDATA/pg_hba.conf"
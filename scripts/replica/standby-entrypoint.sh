@@ -0,0 +1,10 @@
+#!/bin/sh
+# Clones the primary with pg_basebackup on first start, then runs as a hot standby
+set -e
+if [ ! -s "$PGDATA/PG_VERSION" ]; then
+  until pg_isready -h db -U postgres; do sleep 1; done
+  rm -rf "$PGDATA"/*
+  PGPASSWORD=replicator pg_basebackup -h db -U replicator -D "$PGDATA" -R -X stream
+  chmod 700 "$PGDATA"
+fi
+exec postgres -c hot_standby=on